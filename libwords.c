@@ -621,7 +621,7 @@ int fill_board(int max_tries) {
 
 /**
  * Prepare word list for return to caller
- * 
+ *
  * Converts internal hash table to simple array format expected by Python.
  * Legacy function name preserved for compatibility.
  */
@@ -630,6 +630,29 @@ void bws_btree_to_array() {
     g_word_array = word_list;  // Set global pointer for return
 }
 
+// Buffer for the newline-joined form of the found words (see get_words_joined)
+static char joined_words[MAX_WORDS * (MAX_WORD_LEN + 2)];
+
+/**
+ * Return all found words as a single newline-joined string
+ *
+ * Called after get_words()/restore_game() so Python can fetch the entire
+ * result set in one boundary crossing (decode + split) instead of
+ * dereferencing and decoding the word array one element at a time.
+ *
+ * @return Static buffer "WORD1\nWORD2\n..." (empty string if no words)
+ */
+char *get_words_joined() {
+    char *p = joined_words;
+    for (int i = 0; i < word_count; i++) {
+        const char *w = word_list[i];
+        if (p != joined_words) *p++ = '\n';
+        while (*w) *p++ = *w++;
+    }
+    *p = '\0';
+    return joined_words;
+}
+
 /**
  * Generate a random board meeting specified constraints
  * 
@@ -1,6 +1,9 @@
 import asyncio
+import functools
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import websockets
 from websockets.server import WebSocketServerProtocol
 
@@ -9,46 +12,75 @@ from tboggle.dice import DiceSet
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for message encoding when available (install the "server"
+# extra); it serializes the large game_state payloads several times faster
+# than stdlib json. Fall back silently to json otherwise.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 class BoggleBackend:
     def __init__(self, host="localhost", port=8765):
         self.host = host
         self.port = port
+        # Board generation is a long C call that releases the GIL; run it
+        # on one worker thread so the event loop keeps serving other
+        # connections (guesses, new sockets) meanwhile. A single worker
+        # plus the lock below serializes access to libwords' global state.
+        self._board_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="boards")
+        self._board_lock = asyncio.Lock()
 
     async def handle_message(self, websocket: WebSocketServerProtocol, path: str):
         """Handle incoming WebSocket messages."""
+        # Most recent game on this connection; submit_guess sends small
+        # deltas against it instead of re-serializing full game state.
+        game = None
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _loads(message)
                     endpoint = data.get("endpoint")
                     params = data.get("params", {})
-                    
+
                     if endpoint == "restore_game":
                         response = await self.restore_game(params)
+                        game = response.pop("_game", game)
                     elif endpoint == "fill_board":
                         response = await self.fill_board(params)
+                        game = response.pop("_game", game)
+                    elif endpoint == "submit_guess":
+                        response = self.submit_guess(game, params)
                     else:
                         response = {
                             "error": f"Unknown endpoint: {endpoint}",
                             "status": "error"
                         }
                     
-                    await websocket.send(json.dumps(response))
+                    await websocket.send(_dumps(response))
                     
                 except json.JSONDecodeError:
                     error_response = {
                         "error": "Invalid JSON format",
                         "status": "error"
                     }
-                    await websocket.send(json.dumps(error_response))
+                    await websocket.send(_dumps(error_response))
                 except Exception as e:
                     logger.exception("Error handling message")
                     error_response = {
                         "error": str(e),
                         "status": "error"
                     }
-                    await websocket.send(json.dumps(error_response))
+                    await websocket.send(_dumps(error_response))
         except websockets.exceptions.ConnectionClosed:
             logger.info("Client disconnected")
         except Exception as e:
@@ -83,7 +115,10 @@ class BoggleBackend:
                     "status": "error"
                 }
             
-            # Create game instance
+            # Each request gets its own Game — only this connection ever
+            # holds it, so another connection's fill can never clobber a
+            # game mid-play. The lock only guards libwords' global state
+            # during the C call.
             game = Game(
                 dice_set=dice_set,
                 height=height,
@@ -92,10 +127,10 @@ class BoggleBackend:
                 duration=duration,
                 min_legal=min_legal
             )
-            
-            # Restore the game
-            game.restore_game(dice)
-            
+            async with self._board_lock:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._board_executor, game.restore_game, dice)
+
             # Return game state
             return {
                 "status": "success",
@@ -111,9 +146,10 @@ class BoggleBackend:
                     "duration": game.duration,
                     "min_legal": game.min_legal,
                     "scores": game.scores
-                }
+                },
+                "_game": game
             }
-            
+
         except Exception as e:
             logger.exception("Error in restore_game")
             return {
@@ -157,7 +193,8 @@ class BoggleBackend:
                     "status": "error"
                 }
             
-            # Create game instance
+            # Each request gets its own Game (see restore_game); the lock
+            # only guards libwords' global state during the C call.
             game = Game(
                 dice_set=dice_set,
                 height=height,
@@ -166,19 +203,22 @@ class BoggleBackend:
                 duration=duration,
                 min_legal=min_legal
             )
-            
-            # Fill the board
-            game.fill_board(
-                min_words=min_words,
-                max_words=max_words,
-                min_score=min_score,
-                max_score=max_score,
-                min_longest=min_longest,
-                max_longest=max_longest,
-                max_tries=max_tries,
-                random_seed=random_seed
-            )
-            
+            async with self._board_lock:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._board_executor,
+                    functools.partial(
+                        game.fill_board,
+                        min_words=min_words,
+                        max_words=max_words,
+                        min_score=min_score,
+                        max_score=max_score,
+                        min_longest=min_longest,
+                        max_longest=max_longest,
+                        max_tries=max_tries,
+                        random_seed=random_seed
+                    )
+                )
+
             # Return game state
             return {
                 "status": "success",
@@ -194,9 +234,10 @@ class BoggleBackend:
                     "duration": game.duration,
                     "min_legal": game.min_legal,
                     "scores": game.scores
-                }
+                },
+                "_game": game
             }
-            
+
         except Exception as e:
             logger.exception("Error in fill_board")
             return {
@@ -204,10 +245,48 @@ class BoggleBackend:
                 "status": "error"
             }
 
+    def submit_guess(self, game, params: dict) -> dict:
+        """Evaluate one guess against the connection's current game.
+
+        Returns a small delta (result plus updated found-list totals)
+        rather than echoing the full game_state with its legal-word list;
+        the client already holds that from the initial fill/restore and
+        applies the delta locally.
+        """
+        if game is None:
+            return {
+                "error": "No active game; call fill_board or restore_game first",
+                "status": "error"
+            }
+
+        word = params.get("word")
+        if not word:
+            return {
+                "error": "Missing required parameter: word",
+                "status": "error"
+            }
+
+        prev_score = game.found.score
+        result = game.handle_guess(word)
+        return {
+            "status": "success",
+            "result": result.name,
+            "word": word.lower(),
+            "score_delta": game.found.score - prev_score,
+            "found_score": game.found.score,
+            "found_count": len(game.found.words),
+            "found_longest": game.found.longest
+        }
+
     async def start_server(self):
         """Start the WebSocket server."""
         logger.info(f"Starting WebSocket server on {self.host}:{self.port}")
-        async with websockets.serve(self.handle_message, self.host, self.port):
+        # compression=None turns off per-message-deflate: the JSON payloads
+        # are small and sent once, so the ~300KB of zlib window state per
+        # connection and the CPU spent deflating cost more than they save.
+        async with websockets.serve(
+            self.handle_message, self.host, self.port, compression=None
+        ):
             logger.info("WebSocket server started successfully")
             await asyncio.Future()  # Run forever
 
@@ -219,5 +298,21 @@ async def main():
     await backend.start_server()
 
 
+def run():
+    """Run the server, preferring uvloop's event loop when installed.
+
+    uvloop (part of the "server" extra) implements the asyncio event loop
+    in Cython over libuv and roughly halves per-message loop overhead; the
+    stdlib loop is used when it isn't available (e.g. on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
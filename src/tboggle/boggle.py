@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import bisect
 import dataclasses
+import time
 from typing import Optional
 from random import randint
 
@@ -10,7 +12,7 @@ from textual.timer import Timer
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, Container
-from textual.reactive import reactive, var
+from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widget import Widget
 from textual.widgets import Static, Footer, Input, DataTable, Label, Button
@@ -39,14 +41,14 @@ class Board(Widget):
     app: BoggleApp
 
     def on_mount(self) -> None:
-        self.styles.height = 2 * len(self.app.game.board) + 3
+        board = self.app.game.board
+        self.styles.height = 2 * len(board) + 3
+        # The board is fixed for the whole game, so build the rendered
+        # string once instead of re-joining rows on every repaint.
+        self._rendered = "\n\n".join("  ".join(row) for row in board)
 
     def render(self) -> str:
-        lines = []
-        for row in self.app.game.board:
-            line = "  ".join(cell for cell in row)
-            lines.append(line)
-        return "\n\n".join(lines)
+        return self._rendered
 
 
 class LeftPane(Vertical):
@@ -69,6 +71,9 @@ class WordInput(Input):
     def on_mount(self):
         self.history = []
         self.history_at = 0
+        # Register on the app so action handlers skip a tree query; done
+        # here (not in App.on_mount) so the cache survives recomposes.
+        self.app.word_input = self
 
     def action_up(self) -> None:
         if self.history_at > 0:
@@ -88,7 +93,9 @@ class WordInput(Input):
 
     @on(Input.Submitted)
     def submitted(self, event) -> None:
-        word = event.value
+        # Lowercase once here; the game's word sets and the Results list
+        # both use lowercase, so everything downstream reuses this string.
+        word = event.value.lower()
         result = self.app.game.handle_guess(word)
         if result == GuessResult.GOOD:
             self.app.add_word(word)
@@ -100,7 +107,7 @@ class WordInput(Input):
         elif result == GuessResult.NOT_ON_BOARD:
             self.classes = "not-on-board"
         self.value = ""
-        self.history.append(event.value)
+        self.history.append(word)
         self.history_at = len(self.history)
         self.placeholder = word
 
@@ -144,18 +151,48 @@ class StatusArea(Container):
 
 @dataclasses.dataclass
 class Page:
+    # Explicit __slots__ rather than dataclass(slots=True), which needs
+    # Python 3.10; this package still supports 3.9.
+    __slots__ = ("rows", "label", "col_width", "total_words", "col_fmt")
+
     rows: list[list[str]]
     label: str
     col_width: int
     total_words: int
 
+    def __post_init__(self) -> None:
+        # Bound .format for one column label; built once per page so
+        # show_page doesn't re-parse a dynamic format spec per column.
+        # Set here, not as a field: a field's class-level default would
+        # clash with the col_fmt slot.
+        self.col_fmt = ("c{:" + str(self.col_width) + "}").format
+
 class Results(DataTable):
     def on_mount(self) -> None:
         self.cur_page_num = 1
         self.pages = []
+        # Register on the app (see WordInput.on_mount for rationale)
+        self.app.results_widget = self
+        # title -> (set size, sorted words, max word length); see _sorted_words
+        self._sorted_cache = {}
+        # title -> (set size, num_cols, num_rows, pages); see make_list
+        self._pages_cache = {}
+        self._last_size = None
+        # For the cell-highlight handler: scores never change mid-game,
+        # and the #def-area query is looked up once, lazily (the label is
+        # only composed on the post-game screen).
+        self._scores = self.app.game.scores
+        self._def_area = None
         if not self.app.playing:
             self.make_stats()
 
+    def on_resize(self, event) -> None:
+        # Only new geometry invalidates pagination; Textual also fires
+        # Resize on mount and after recomposes with the size unchanged.
+        if event.size != self._last_size:
+            self._last_size = event.size
+            self._pages_cache.clear()
+
     def on_key(self, event) -> None:
         if event.key == "space" and self.cur_page_num < len(self.pages):
             self.show_page(self.cur_page_num + 1)
@@ -163,27 +200,74 @@ class Results(DataTable):
             self.show_page(self.cur_page_num - 1)
 
     def on_data_table_cell_highlighted(self, event) -> None:
-        if not self.disabled and event.value and not self.app.playing:
-            word = event.value
-            defn = escape(get_def(word) or "(nothing found)")
-            score = self.app.game.scores[len(word)]
-            self.app.query_one("#def-area").update(f"[u]{word} ({score})[/]: [i]{defn}[/]")
+        # Fires on every arrow keypress; bail out cheapest-check-first.
+        if self.disabled:
+            return
+        if not event.value:
+            return
+        if self.app.playing:
+            return
+        word = event.value
+        defn = escape(get_def(word) or "(nothing found)")
+        score = self._scores[len(word)]
+        if self._def_area is None:
+            self._def_area = self.app.query_one("#def-area")
+        self._def_area.update(f"[u]{word} ({score})[/]: [i]{defn}[/]")
+
+    def _sorted_words(self, title: str, words_set: set[str]) -> tuple[list[str], int]:
+        """Return (sorted words, longest length) for a list, with caching.
+
+        The word sets only grow during play, so a cached sort keyed on the
+        set's size stays valid until a word is added; redraws between
+        guesses (page flips, list switches) skip the re-sort and re-scan.
+        """
+        cached = self._sorted_cache.get(title)
+        if cached is not None and cached[0] == len(words_set):
+            return cached[1], cached[2]
+
+        words = sorted(words_set)
+        width = max(map(len, words)) if words else 0
+        self._sorted_cache[title] = (len(words), words, width)
+        return words, width
+
+    def append_word(self, word: str) -> None:
+        """Add one newly accepted word (already lowercase) to the
+        displayed Found list.
+
+        Keeps the cached sort current with a single bisect insertion
+        instead of a full re-sort. Patching just the new word's cell was
+        considered, but a word inserted mid-list shifts every cell after
+        it, so the table redraw itself can't be skipped safely.
+        """
+        cached = self._sorted_cache.get("Found")
+        if cached is not None:
+            size, words, width = cached
+            bisect.insort(words, word)
+            self._sorted_cache["Found"] = (size + 1, words, max(width, len(word)))
+        self.make_list("Found", self.app.game.found.words)
 
     def make_list(self, title: str, words_set: set[str]) -> None:
         self.header_height = 0
 
-        words = list(sorted(words_set))
+        words, width = self._sorted_words(title, words_set)
         if not words:
             self.pages = [Page([], title, 0, 0)]
         else:
-            width = max(len(w) for w in words)
             num_cols = (self.size.width - 4) // (width + 3)
             num_rows = self.size.height
-            self.pages = [
-                Page(rows, title, width, len(words))
-                for rows
-                in fill.fill(words, num_cols, num_rows)
-            ]
+
+            # Pagination only changes when the list grows or the terminal
+            # is resized; reuse the cached pages otherwise.
+            cached = self._pages_cache.get(title)
+            if cached is not None and cached[:3] == (len(words), num_cols, num_rows):
+                self.pages = cached[3]
+            else:
+                self.pages = [
+                    Page(rows, title, width, len(words))
+                    for rows
+                    in fill.fill(words, num_cols, num_rows)
+                ]
+                self._pages_cache[title] = (len(words), num_cols, num_rows, self.pages)
 
         self.show_page(1)
 
@@ -205,7 +289,7 @@ class Results(DataTable):
         self.border_subtitle = f"{num}/{len(self.pages)}{nav}"
         self.clear(columns=True)
         if p.rows:
-            self.add_columns(*(f"c{x:{p.col_width}}" for x in p.rows[0]))
+            self.add_columns(*map(p.col_fmt, p.rows[0]))
             self.add_rows(p.rows)
         if not self.app.playing:
             self.focus()
@@ -230,23 +314,34 @@ class Results(DataTable):
         
         self.disabled = True
     
+    @staticmethod
+    def _pct(part: int, total: int) -> str:
+        """Format part/total as "NN.NN%" using integer math only.
+
+        Avoids the float divide and format-spec machinery of f"{x:.2%}";
+        returns "0.00%" when total is zero.
+        """
+        if not total:
+            return "0.00%"
+        basis = (10000 * part + total // 2) // total
+        return f"{basis // 100}.{basis % 100:02}%"
+
     def _get_basic_stats(self, game: Game) -> list[tuple[str, str, str]]:
         """Get basic game statistics."""
         dice_set_name = game.dice_set.name
         dice_set_desc = game.dice_set.desc
-        
-        # Calculate percentages with zero-division protection
+
         total_legal = len(game.legal.words)
         total_found = len(game.found.words)
-        words_percentage = f"{(total_found / total_legal):.2%}" if total_legal > 0 else "0.00%"
-        
+        words_percentage = self._pct(total_found, total_legal)
+
         total_legal_score = game.legal.score
         found_score = game.found.score
-        score_percentage = f"{(found_score / total_legal_score):.2%}" if total_legal_score > 0 else "0.00%"
+        score_percentage = self._pct(found_score, total_legal_score)
         
         return [
             (f"Scoring",),
-            (f"  {'/'.join(str(s) for s in game.scores)}",),
+            (f"  {game.scores_str}",),
             (f"Dice Set    {dice_set_name} {dice_set_desc}",),
             (f"Board Size  {game.width}x{game.height}",),
             (f"Found       {total_found}/{total_legal}  {words_percentage}",),
@@ -272,6 +367,10 @@ class Results(DataTable):
 class BoggleApp(App):
     CSS_PATH = "styles.css"
     ENABLE_COMMAND_PALETTE = False
+    # Registered as a named screen so Textual builds the modal's widgets
+    # once and reuses the instance on every Ctrl+Q, instead of composing
+    # a fresh screen per open.
+    SCREENS = {"exit": ExitModal}
     BINDINGS = [
         Binding("escape", "pause", "Pause"),
         Binding("ctrl+e", "end", "End game", priority=True),
@@ -287,39 +386,74 @@ class BoggleApp(App):
         Binding("ctrl+q", "quit", "Quit"),
     ]
 
-    timer = var(True)
     playing = reactive(True, recompose=True, init=False)
 
+    # Found-list totals; watchers push changes to the status labels, so a
+    # value that didn't change (usually "longest") costs no label repaint.
+    num_found = reactive(0, init=False)
+    found_score = reactive(0, init=False)
+    found_longest = reactive(0, init=False)
+
     def __init__(self, game: Game) -> None:
         self.game = game
         self.time_left = game.duration
         self.time_max = game.duration
         self.my_timer: Optional[Timer] = None
         self.time_widget: Optional[Label] = None  # Cache for timer widget
+        self._t0 = 0.0              # Monotonic time at game start
+        self._paused_seconds = 0.0  # Total time spent in the pause modal
+        self._pause_t = 0.0         # Monotonic time the current pause began
+        self._timer_color: Optional[str] = None  # Current warning color
+        self.score_widget: Optional[Label] = None
+        self.words_widget: Optional[Label] = None
+        self.long_widget: Optional[Label] = None
+        self.results_widget: Optional[Results] = None
+        self.word_input: Optional[WordInput] = None
         super().__init__()
 
     def on_mount(self) -> None:
         if self.game.duration:
+            self._t0 = time.monotonic()
             self.my_timer = self.set_interval(1, self.update_timer)
-            # Cache the timer widget reference for performance
-            try:
-                self.time_widget = self.query_one("#num_time")
-            except:
-                self.time_widget = None
+            # Cache the timer widget reference for performance; the label is
+            # always composed when a duration is set, so no try/except.
+            self.time_widget = self.query_one("#num_time", Label)
+
+        # Cache the labels add_word touches on every accepted guess;
+        # selector queries walk the whole widget tree each time. (Results
+        # and WordInput register themselves in their own on_mount.)
+        self.score_widget = self.query_one("#num-score")
+        self.words_widget = self.query_one("#num-words")
+        self.long_widget = self.query_one("#num-long")
 
     def update_timer(self) -> None:
-        if self.timer and self.time_widget:
-            self.time_left -= 1
-            self.time_widget.update(str(self.time_left))
-            if self.time_left == 0:
+        if self.time_widget:
+            # Derive the remaining time from the monotonic clock instead of
+            # counting ticks, so ticks the event loop delays or batches
+            # can't drift the game clock.
+            elapsed = time.monotonic() - self._t0 - self._paused_seconds
+            new_left = max(self.time_max - int(elapsed), 0)
+            if new_left == self.time_left:
+                return
+            self.time_left = new_left
+            self.time_widget.update(str(new_left))
+            if new_left == 0:
                 self.action_end()
-            elif self.time_left < TIMER_DANGER_THRESHOLD:
-                self.time_widget.styles.color = "red"
+                return
+
+            # Only touch the style system when the warning bucket changes;
+            # re-assigning the same color every tick forces a repaint.
+            if self.time_left < TIMER_DANGER_THRESHOLD:
+                color = "red"
             elif self.time_left < TIMER_WARNING_THRESHOLD:
-                self.time_widget.styles.color = "orange"
+                color = "orange"
+            else:
+                color = None
+            if color is not None and color != self._timer_color:
+                self._timer_color = color
+                self.time_widget.styles.color = color
 
     def action_end(self) -> None:
-        self.timer = False
         if self.game.duration:
             self.my_timer.stop()
         self.playing = False
@@ -361,49 +495,61 @@ class BoggleApp(App):
 
     def action_quit(self) -> None:
         """Called when the user hits Ctrl+Q."""
-        self.push_screen(ExitModal())
+        self.push_screen("exit")
 
     def action_lookup(self) -> None:
         self.push_screen(LookupModal())
 
     def action_pause(self) -> None:
         def restart_timer(_):
-            self.query_one("Input").disabled = False
-            self.timer = True
-
-        self.query_one("Input").disabled = True
-        self.timer = False
+            self._paused_seconds += time.monotonic() - self._pause_t
+            self.word_input.disabled = False
+            self.my_timer.resume()
+
+        self.word_input.disabled = True
+        # Pausing the interval stops the wake-ups entirely while the modal
+        # is open; the accumulated pause time keeps the clock math honest.
+        self._pause_t = time.monotonic()
+        self.my_timer.pause()
         self.push_screen(PauseModal(), restart_timer)
 
     def action_found(self) -> None:
-        self.query_one(Results).make_list("Found", self.game.found.words)
+        self.results_widget.make_list("Found", self.game.found.words)
 
     def action_missed(self) -> None:
-        self.query_one(Results).make_list("Missed", self.game.get_missed())
+        self.results_widget.make_list("Missed", self.game.get_missed())
 
     def action_bad(self) -> None:
-        self.query_one(Results).make_list("Bad", self.game.bad.words)
+        self.results_widget.make_list("Bad", self.game.bad.words)
 
     def action_stats(self) -> None:
-        self.query_one(Results).make_stats()
+        self.results_widget.make_stats()
 
     # -------------------------------
 
+    def watch_num_found(self, value: int) -> None:
+        if self.words_widget:
+            self.words_widget.update(str(value))
+
+    def watch_found_score(self, value: int) -> None:
+        if self.score_widget:
+            self.score_widget.update(str(value))
+
+    def watch_found_longest(self, value: int) -> None:
+        if self.long_widget:
+            self.long_widget.update(str(value))
+
     def add_word(self, word: str) -> None:
-        found = self.query_one(Results)
-        found.make_list("Found", self.game.found.words)
+        found = self.results_widget
+        found.append_word(word)
         found.cursor_type = "none"
-        
-        # Batch widget queries for better performance
+
+        # One layout/paint pass; only labels whose value changed repaint
         f = self.game.found
-        score_widget = self.query_one("#num-score")
-        words_widget = self.query_one("#num-words")
-        long_widget = self.query_one("#num-long")
-        
-        # Update all widgets
-        score_widget.update(str(f.score))
-        words_widget.update(str(len(f.words)))
-        long_widget.update(str(f.longest))
+        with self.batch_update():
+            self.num_found = len(f.words)
+            self.found_score = f.score
+            self.found_longest = f.longest
 
 
 def main() -> None:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import dataclasses
+import json
+import os
 from pathlib import Path
-import pickle
 
 from textual import on
 from textual.app import App, ComposeResult
@@ -14,6 +15,13 @@ from tboggle.dice import sets
 
 @dataclasses.dataclass
 class Choices:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10); this
+    # object lives for the whole app run, so skip the __dict__.
+    __slots__ = (
+        "set", "legal_min", "timeout", "min_words", "max_words",
+        "min_score", "max_score", "min_longest", "max_longest", "scores",
+    )
+
     set: str
     legal_min: int
     timeout: int
@@ -25,9 +33,62 @@ class Choices:
     max_longest: int
     scores: tuple[int]
 
-PREF_FILE = Path.home() / "tboggle-prefs.pickle"
-if not (PREF_FILE).exists():
-    defaults = Choices(
+    def __setstate__(self, state):
+        # Legacy pickled prefs carried a __dict__; map it onto the slots.
+        if isinstance(state, tuple):  # (dict_state, slots_state)
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+# Score tables for the "Scores" select, built once at import rather than
+# on every compose.
+SCORE_OPTIONS = [
+    ("Flat: 1",
+     (0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1)),
+    ("Flat: 1-16",
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16)),
+    ("Squares: 1-256",
+     (0, 1, 4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225, 256)),
+    ("Fibonnaci: 1-377",
+     (0, 0, 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377)),
+    ("Basic: 1-11",
+     (0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11)),
+    ("Basic+: 1-11 +2ea for 9+",
+     (0, 0, 0, 1, 1, 2, 3, 5, 11, 18, 20, 22, 24, 26, 28, 30, 32)),
+    ("Prefer big: 1-50",
+     (0, 0, 0, 1, 1, 2, 4, 6, 9, 12, 16, 20, 25, 30, 36, 42, 50)),
+]
+
+PREF_FILE = Path.home() / "tboggle-prefs.json"
+_LEGACY_PREF_FILE = Path.home() / "tboggle-prefs.pickle"
+
+
+def _load_defaults() -> Choices:
+    """Load saved preferences, falling back to the built-in defaults.
+
+    Preferences are a plain JSON dict; older installs saved a pickled
+    Choices, which is read once here and rewritten as JSON on the next
+    save.
+    """
+    try:
+        with open(PREF_FILE, "rb") as f:
+            data = json.loads(f.read())
+        return Choices(**{**data, "scores": tuple(data["scores"])})
+    except FileNotFoundError:
+        pass
+    except (ValueError, TypeError, KeyError):
+        pass  # unreadable prefs file; use defaults
+
+    if _LEGACY_PREF_FILE.exists():
+        import pickle
+        try:
+            with open(_LEGACY_PREF_FILE, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+
+    return Choices(
             set="4",
             legal_min=3,
             timeout=180,
@@ -39,9 +100,19 @@ if not (PREF_FILE).exists():
             max_longest=16,
             scores=(0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11),
     )
-else:
-    with open(PREF_FILE, "rb") as f:
-        defaults = pickle.load(f)
+
+
+def _save_defaults(choices: Choices) -> None:
+    """Write preferences as JSON, atomically via rename."""
+    tmp = PREF_FILE.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(dataclasses.asdict(choices), f)
+    os.replace(tmp, PREF_FILE)
+
+
+# Loaded lazily on first Chooser construction, so merely importing this
+# module (as boggle.py does at startup) never touches the prefs file.
+defaults = None
 
 class Chooser(App):
     TITLE = "Boggle"
@@ -94,6 +165,12 @@ class Chooser(App):
 
     ENABLE_COMMAND_PALETTE = False
 
+    def __init__(self) -> None:
+        global defaults
+        if defaults is None:
+            defaults = _load_defaults()
+        super().__init__()
+
     def compose(self) -> ComposeResult:
         yield Header()
 
@@ -141,22 +218,7 @@ class Chooser(App):
 
                     yield Label("Scores:")
                     yield Select(
-                            [
-                                ("Flat: 1", 
-                                 (0, 0, 0, 1, 1, 1, 1, 1, 1,  1,  1,  1,  1,  1,   1,   1,   1)),
-                                ("Flat: 1-16", 
-                                 (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16)),
-                                ("Squares: 1-256", 
-                                 (0, 1, 4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225, 256)),
-                                ("Fibonnaci: 1-377", 
-                                 (0, 0, 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377)),
-                                ("Basic: 1-11", 
-                                 (0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11)),
-                                ("Basic+: 1-11 +2ea for 9+", 
-                                 (0, 0, 0, 1, 1, 2, 3, 5, 11, 18, 20, 22, 24, 26, 28, 30, 32)),
-                                ("Prefer big: 1-50",
-                                 (0, 0, 0, 1, 1, 2, 4, 6, 9, 12, 16, 20, 25, 30, 36, 42, 50)),
-                                ],
+                            SCORE_OPTIONS,
                             prompt="Choose scores",
                             id="scores",
                             value=defaults.scores,
@@ -191,17 +253,30 @@ class Chooser(App):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Each query_one walks the DOM matching a selector; grab the form
+        # widgets once so every Play/Save press is plain attribute reads.
+        self._w = {
+            wid: self.query_one(f"#{wid}")
+            for wid in (
+                "set", "legal-min", "timeout", "scores",
+                "min-words", "max-words", "min-score", "max-score",
+                "min-longest", "max-longest",
+            )
+        }
+
     def set_to_defaults(self):
-        defaults.set=self.query_one("#set").value
-        defaults.legal_min=int(self.query_one("#legal-min").value)
-        defaults.timeout=int(self.query_one("#timeout").value)
-        defaults.min_words=int(self.query_one("#min-words").value)
-        defaults.max_words=int(self.query_one("#max-words").value)
-        defaults.min_score=int(self.query_one("#min-score").value)
-        defaults.max_score=int(self.query_one("#max-score").value)
-        defaults.min_longest=int(self.query_one("#min-longest").value)
-        defaults.max_longest=int(self.query_one("#max-longest").value)
-        defaults.scores=self.query_one("#scores").value
+        w = self._w
+        defaults.set = w["set"].value
+        defaults.legal_min = int(w["legal-min"].value)
+        defaults.timeout = int(w["timeout"].value)
+        defaults.min_words = int(w["min-words"].value)
+        defaults.max_words = int(w["max-words"].value)
+        defaults.min_score = int(w["min-score"].value)
+        defaults.max_score = int(w["max-score"].value)
+        defaults.min_longest = int(w["min-longest"].value)
+        defaults.max_longest = int(w["max-longest"].value)
+        defaults.scores = w["scores"].value
 
     @on(Button.Pressed, "#play")
     def action_play(self):
@@ -215,8 +290,7 @@ class Chooser(App):
     @on(Button.Pressed, "#save")
     def action_save(self):
         self.set_to_defaults()
-        with open(PREF_FILE, "wb") as prefs:
-            pickle.dump(defaults, prefs)
+        _save_defaults(defaults)
         self.notify(f"Saved to {PREF_FILE}", title="Saved")
 
     @on(Button.Pressed, "#restore")
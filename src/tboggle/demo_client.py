@@ -13,13 +13,12 @@ Make sure to start the backend server first:
 """
 
 import asyncio
+import heapq
 import json
-import websockets
 import logging
+import sys
 from typing import Dict, Any
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +31,10 @@ class TBoggleClient:
     
     async def connect(self):
         """Connect to the WebSocket server."""
+        # Imported here so just loading this module stays cheap; websockets
+        # pulls in a sizable dependency tree only needed once connecting.
+        import websockets
+
         try:
             self.websocket = await websockets.connect(self.uri)
             logger.info(f"Connected to TBoggle server at {self.uri}")
@@ -47,85 +50,96 @@ class TBoggleClient:
     
     async def send_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Send a request to the server and return the response."""
+        await self.send_only(endpoint, params)
+        return await self.recv_response(endpoint)
+
+    async def send_only(self, endpoint: str, params: Dict[str, Any]) -> None:
+        """Send a request without waiting for its response.
+
+        The server answers in order on each connection, so several
+        requests can be pipelined back-to-back and their responses read
+        with recv_response afterwards, saving a round trip apiece.
+        """
         if not self.websocket:
             raise Exception("Not connected to server")
-        
+
         message = {
             "endpoint": endpoint,
             "params": params
         }
-        
+
         logger.info(f"Sending request to {endpoint}")
         await self.websocket.send(json.dumps(message))
-        
+
+    async def recv_response(self, endpoint: str) -> Dict[str, Any]:
+        """Read the next response off the socket."""
         response = await self.websocket.recv()
         result = json.loads(response)
-        
+
         if result["status"] == "error":
             logger.error(f"Server error: {result['error']}")
         else:
             logger.info(f"Request to {endpoint} successful")
-        
+
         return result
     
-    async def restore_game_demo(self):
-        """Demonstrate the restore_game endpoint."""
+    # Demo request parameters, built once at class level
+    RESTORE_PARAMS = {
+        "dice_set": "4-classic",
+        "height": 4,
+        "width": 4,
+        "scores": [0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11],
+        "dice": "ADYERESTLPNAGIE1",  # Specific dice configuration
+        "duration": 180,
+        "min_legal": 3
+    }
+
+    FILL_PARAMS = {
+        "dice_set": "4-classic",
+        "height": 4,
+        "width": 4,
+        "scores": [0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11],
+        "duration": 180,
+        "min_legal": 3,
+        "min_words": 30,      # At least 30 words
+        "max_words": 100,     # At most 100 words
+        "min_score": 50,      # At least 50 points
+        "max_score": 200,     # At most 200 points
+        "min_longest": 6,     # At least one 6-letter word
+        "max_longest": 12,    # No words longer than 12 letters
+        "random_seed": 42     # For reproducible results
+    }
+
+    def restore_game_demo(self, result: Dict[str, Any]):
+        """Show the restore_game endpoint's request and response."""
+        params = self.RESTORE_PARAMS
         print("\n" + "="*60)
         print("🎲 RESTORE GAME DEMO")
         print("="*60)
         print("This demo restores a specific Boggle game using predefined dice.")
         print("The dice string represents the face of each die on the board.")
-        
-        params = {
-            "dice_set": "4-classic",
-            "height": 4,
-            "width": 4,
-            "scores": [0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11],
-            "dice": "ADYERESTLPNAGIE1",  # Specific dice configuration
-            "duration": 180,
-            "min_legal": 3
-        }
-        
+
         print(f"\nParameters:")
         print(f"  Dice Set: {params['dice_set']}")
         print(f"  Board Size: {params['height']}x{params['width']}")
         print(f"  Dice Configuration: {params['dice']}")
         print(f"  Game Duration: {params['duration']} seconds")
         print(f"  Minimum Word Length: {params['min_legal']}")
-        
-        result = await self.send_request("restore_game", params)
-        
+
         if result["status"] == "success":
             self.display_game_state(result["game_state"], "Restored Game")
         else:
             print(f"❌ Error: {result['error']}")
-        
-        return result
-    
-    async def fill_board_demo(self):
-        """Demonstrate the fill_board endpoint."""
+
+    def fill_board_demo(self, result: Dict[str, Any]):
+        """Show the fill_board endpoint's request and response."""
+        params = self.FILL_PARAMS
         print("\n" + "="*60)
         print("🎯 FILL BOARD DEMO")
         print("="*60)
         print("This demo generates a new random Boggle board with constraints.")
         print("The board will be optimized to meet the specified criteria.")
-        
-        params = {
-            "dice_set": "4-classic",
-            "height": 4,
-            "width": 4,
-            "scores": [0, 0, 0, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11],
-            "duration": 180,
-            "min_legal": 3,
-            "min_words": 30,      # At least 30 words
-            "max_words": 100,     # At most 100 words
-            "min_score": 50,      # At least 50 points
-            "max_score": 200,     # At most 200 points
-            "min_longest": 6,     # At least one 6-letter word
-            "max_longest": 12,    # No words longer than 12 letters
-            "random_seed": 42     # For reproducible results
-        }
-        
+
         print(f"\nParameters:")
         print(f"  Dice Set: {params['dice_set']}")
         print(f"  Board Size: {params['height']}x{params['width']}")
@@ -133,46 +147,49 @@ class TBoggleClient:
         print(f"  Score Range: {params['min_score']}-{params['max_score']}")
         print(f"  Longest Word Range: {params['min_longest']}-{params['max_longest']} letters")
         print(f"  Random Seed: {params['random_seed']}")
-        
-        result = await self.send_request("fill_board", params)
-        
+
         if result["status"] == "success":
             self.display_game_state(result["game_state"], "Generated Board")
         else:
             print(f"❌ Error: {result['error']}")
-        
-        return result
     
     def display_game_state(self, game_state: Dict[str, Any], title: str):
-        """Display the game state in a formatted way."""
-        print(f"\n📊 {title.upper()} RESULTS")
-        print("-" * 40)
-        
+        """Display the game state in a formatted way.
+
+        Output is accumulated and written with a single stdout write
+        rather than dozens of line-buffered prints.
+        """
+        parts = [f"\n📊 {title.upper()} RESULTS\n", "-" * 40, "\n"]
+
         # Display the board
-        print("🎲 Board:")
+        parts.append("🎲 Board:\n")
         board = game_state["board"]
-        for row in board:
-            print("    " + " ".join(f"{cell:>2}" for cell in row))
-        
+        parts.append("\n".join(
+            "    " + " ".join(f"{cell:>2}" for cell in row) for row in board
+        ))
+
         # Display statistics
-        print(f"\n📈 Statistics:")
-        print(f"  Total Legal Words: {len(game_state['legal_words'])}")
-        print(f"  Total Possible Score: {game_state['legal_score']}")
-        print(f"  Longest Word Length: {game_state['legal_longest']}")
-        print(f"  Words Found: {len(game_state['found_words'])}")
-        print(f"  Current Score: {game_state['found_score']}")
-        
+        parts.append(f"\n\n📈 Statistics:\n")
+        parts.append(f"  Total Legal Words: {len(game_state['legal_words'])}\n")
+        parts.append(f"  Total Possible Score: {game_state['legal_score']}\n")
+        parts.append(f"  Longest Word Length: {game_state['legal_longest']}\n")
+        parts.append(f"  Words Found: {len(game_state['found_words'])}\n")
+        parts.append(f"  Current Score: {game_state['found_score']}\n")
+
         # Display some example words
         legal_words = game_state['legal_words']
         if legal_words:
-            print(f"\n📝 Sample Legal Words:")
-            # Show first 10 words, sorted by length
-            sample_words = sorted(legal_words, key=len, reverse=True)[:10]
+            parts.append(f"\n📝 Sample Legal Words:\n")
+            # Show the 10 longest words; nlargest is O(n log 10) where a
+            # full length-sort would be O(n log n)
+            sample_words = heapq.nlargest(10, legal_words, key=len)
             for i, word in enumerate(sample_words, 1):
-                print(f"  {i:2}. {word} ({len(word)} letters)")
-            
+                parts.append(f"  {i:2}. {word} ({len(word)} letters)\n")
+
             if len(legal_words) > 10:
-                print(f"  ... and {len(legal_words) - 10} more words")
+                parts.append(f"  ... and {len(legal_words) - 10} more words\n")
+
+        sys.stdout.write("".join(parts))
     
     async def run_demo(self):
         """Run the complete demo."""
@@ -182,13 +199,17 @@ class TBoggleClient:
         
         try:
             await self.connect()
-            
-            # Demo 1: Restore a specific game
-            await self.restore_game_demo()
-            
-            # Demo 2: Generate a new board
-            await self.fill_board_demo()
-            
+
+            # Pipeline both demo requests on the persistent connection:
+            # send them back-to-back, then read the two responses (the
+            # server replies in order), so the demos cost one round trip
+            # instead of two.
+            await self.send_only("restore_game", self.RESTORE_PARAMS)
+            await self.send_only("fill_board", self.FILL_PARAMS)
+
+            self.restore_game_demo(await self.recv_response("restore_game"))
+            self.fill_board_demo(await self.recv_response("fill_board"))
+
             print("\n" + "="*60)
             print("✅ Demo completed successfully!")
             print("="*60)
@@ -205,6 +226,7 @@ class TBoggleClient:
 
 async def main():
     """Main entry point for the demo."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     client = TBoggleClient()
     await client.run_demo()
 
@@ -1,37 +1,39 @@
 class DiceSet:
+    __slots__ = ("name", "desc", "num", "dice", "face_display")
+
     def __init__(self, name, desc, num, dice):
         self.name = name
         self.desc = desc
         self.num = num
-        self.dice = dice
+        # Immutable: the table below is module-level shared state.
+        self.dice = tuple(dice)
+        # Display form of every face this set can roll, built once so
+        # board construction is a plain dict lookup per cell. "0" (blank)
+        # is excluded; it has no display form.
+        self.face_display = {
+            c: _FACE_DISPLAY.get(c) or f"{c} "
+            for die in self.dice for c in die if c != "0"
+        }
 
     @classmethod
     def get_by_name(cls, name):
-        for d in sets:
-            if d.name == name:
-                return d
-        return None
+        return _SETS_BY_NAME.get(name)
 
     def get_face_display(self, face):
         if face == "0":
             raise NotImplementedError()
-        elif face == '1':
-            return "Qu"
-        elif face == '2':
-            return "In"
-        elif face == "3":
-            return "Th"
-        elif face == "4":
-            return "Er"
-        elif face == "5":
-            return "He"
-        elif face == "6":
-            return "An"
-        else:
-            return f"{face} "
+        return _FACE_DISPLAY.get(face) or f"{face} "
 
 
 # #0 = Blank 1 = Qu 2 = In 3 = Th 4 = Er 5 = He 6 = An
+_FACE_DISPLAY = {
+    "1": "Qu",
+    "2": "In",
+    "3": "Th",
+    "4": "Er",
+    "5": "He",
+    "6": "An",
+}
 
 
 # noinspection SpellCheckingInspection
@@ -132,3 +134,7 @@ sets = [
             "HIRSTV", "HOPRST", "IPRSYY", "JK1WXZ", "NOOTUW", "OOOTTU",
         ]),
 ]
+
+# Index for DiceSet.get_by_name; lookups happen per request in the
+# websocket backend, so a dict beats scanning the list each time.
+_SETS_BY_NAME = {s.name: s for s in sets}
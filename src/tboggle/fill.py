@@ -28,51 +28,24 @@ def fill(words: List[T], col_pp: int, rows_pp: int) -> List[List[List[T]]]:
         ... ]
         True
     """
-    def create_columns(page_words: List[T], num_cols: int) -> List[List[T]]:
-        columns = []
-        for col in range(num_cols):
-            column_items = [
-                page_words[col * rows_pp + row]
-                for row in range(rows_pp)
-                if col * rows_pp + row < len(page_words)
-            ]
-            columns.append(column_items)
-        return columns
-
-    def transpose_to_rows(columns: List[List[T]]) -> List[List[T]]:
-        rows = []
-        for row_idx in range(rows_pp):
-            row_items = [
-                col[row_idx] for col in columns
-                if row_idx < len(col)
-            ]
-            if row_items:
-                rows.append(row_items)
-        return rows
-
-    def pad_rows(rows: List[List[T]]) -> None:
-        if not rows:
-            return
-        target_length = len(rows[0])
-        for row in rows:
-            row.extend([''] * (target_length - len(row)))
-
-    pages = []
-    pos = 0
     items_per_page = col_pp * rows_pp
+    n = len(words)
+    pages = []
 
-    while pos < len(words):
-        page_words = words[pos:pos + items_per_page]
-
-        # Calculate actual columns needed for this page
-        actual_cols = min(col_pp, (len(page_words) + rows_pp - 1))
+    for start in range(0, n, items_per_page):
+        end = min(start + items_per_page, n)
+        count = end - start
 
-        # Process page layout
-        columns = create_columns(page_words, actual_cols)
-        rows = transpose_to_rows(columns)
-        pad_rows(rows)
+        # Row r of the column-wise layout is every rows_pp'th item starting
+        # at start + r; striding directly over the full list gives each
+        # display row in one C-level pass with no intermediate per-page copy.
+        num_cols = (count + rows_pp - 1) // rows_pp
+        rows = []
+        for r in range(min(rows_pp, count)):
+            row = words[start + r:end:rows_pp]
+            if len(row) < num_cols:
+                row += [''] * (num_cols - len(row))
+            rows.append(row)
         pages.append(rows)
 
-        pos += items_per_page
-
     return pages
@@ -1,32 +1,40 @@
+import fnmatch
+import functools
 import sqlite3
 import os
-import glob
+import sys
+import threading
 from random import randint
 from ctypes import cdll, POINTER, c_int, c_short, c_char_p, byref
 from enum import Enum
-from collections import Counter
+from collections import defaultdict
 from typing import Optional
 
 from tboggle.dice import DiceSet
 
 
+@functools.cache
 def _find_libwords() -> str:
     """Find libwords shared object.
-    
+
     Returns:
         Path to the libwords shared library file.
-        
+
     Raises:
         FileNotFoundError: If no libwords shared library is found.
     """
     module_dir = os.path.dirname(__file__)
-    pattern = os.path.join(module_dir, "libwords*.so")
-    matches = glob.glob(pattern)
-    
+    # scandir + fnmatch instead of glob: one directory read, no per-match
+    # stat calls.
+    matches = sorted(
+        entry.path for entry in os.scandir(module_dir)
+        if fnmatch.fnmatch(entry.name, "libwords*.so")
+    )
+
     if not matches:
         raise FileNotFoundError(
             f"No libwords shared library found in {module_dir}. "
-            f"Expected files matching pattern: {pattern}"
+            f"Expected files matching pattern: libwords*.so"
         )
     
     if len(matches) > 1:
@@ -37,9 +45,34 @@ def _find_libwords() -> str:
 
 c_words = cdll.LoadLibrary(_find_libwords())
 
+# Declare C function prototypes once at load time. Without argtypes/restype,
+# ctypes re-derives argument conversions on every call; binding them here makes
+# each call a straight dispatch into the library.
+c_words.read_dawg.argtypes = [c_char_p]
+c_words.read_dawg.restype = None
+c_words.get_words.argtypes = [
+    POINTER(c_char_p),  # dice set
+    POINTER(c_int),     # scores
+    c_int, c_int,       # width, height
+    c_int, c_int,       # min_words, max_words
+    c_int, c_int,       # min_score, max_score
+    c_int, c_int,       # min_longest, max_longest
+    c_int,              # min_legal
+    c_int,              # max_tries
+    c_int,              # random_seed
+    POINTER(c_int),     # num_tries (out)
+    POINTER(c_char_p),  # board string (out)
+]
+c_words.get_words.restype = POINTER(c_char_p)
+c_words.restore_game.argtypes = [POINTER(c_int), c_int, c_int, c_char_p]
+c_words.restore_game.restype = POINTER(c_char_p)
+c_words.get_words_joined.argtypes = []
+c_words.get_words_joined.restype = c_char_p
+
 def read_dawg(path: str) -> None:
     c_words.read_dawg(c_char_p(path.encode("utf8")))
 
+@functools.cache
 def _find_data_file(filename: str) -> str:
     """Find data file in package.
     
@@ -61,57 +94,107 @@ def _find_data_file(filename: str) -> str:
     print(f"Warning: using local copy {filename}")
     return filename
 
-read_dawg(_find_data_file("words.dat"))
-db = sqlite3.connect(_find_data_file("all.sqlite3"))
+# Load the DAWG dictionary in a background thread rather than stalling
+# import on the file read; read_dawg is a single C call that releases the
+# GIL, so it overlaps the rest of startup (textual imports, UI setup).
+# Board operations wait on _dawg_ready before their first C call.
+_dawg_ready = threading.Event()
+
+def _preload_dawg() -> None:
+    read_dawg(_find_data_file("words.dat"))
+    _dawg_ready.set()
+
+threading.Thread(target=_preload_dawg, daemon=True).start()
+
+# Opened read-only via URI, and marked immutable: the packaged database
+# never changes, so SQLite can skip file locking and change detection
+# entirely — reads from any thread (the websocket backend shares this
+# connection) never contend on the file.
+db = sqlite3.connect(
+    f"file:{_find_data_file('all.sqlite3')}?mode=ro&immutable=1",
+    uri=True,
+    check_same_thread=False,
+)
+
+# The definitions DB is read-only, so skip journal/fsync machinery, serve
+# pages from a ~20MB cache backed by mmap, and keep any temp state in memory.
+# (defs.word is the primary key, so lookups are already index-backed.)
+for _pragma in (
+        "journal_mode=OFF",
+        "synchronous=OFF",
+        "cache_size=-20000",
+        "mmap_size=268435456",
+        "temp_store=MEMORY",
+        "query_only=1",
+):
+    db.execute(f"PRAGMA {_pragma}")
+
 GET_WORD_SQL = "SELECT def FROM defs WHERE word = ?"
+
+# One long-lived cursor for definition lookups: db.execute constructs a
+# fresh cursor per call, while reusing this one just rebinds parameters on
+# the already-prepared statement.
+_def_cursor = db.cursor()
+
+@functools.lru_cache(maxsize=4096)
+def _get_def_uncached(word: str) -> str:
+    """Look up an already-uppercased word in the definitions database."""
+    defn = _def_cursor.execute(GET_WORD_SQL, (word,)).fetchone()
+    return "" if defn is None else defn[0]
+
 def get_def(word: str) -> str:
     """Get dictionary definition for a word.
-    
+
     Args:
         word: The word to look up (case insensitive).
-        
+
     Returns:
         Definition string, or empty string if not found.
+
+    Results are memoized, so repeat lookups of the same word skip SQLite
+    entirely. Case is normalized before the cache so "cat" and "CAT"
+    share an entry.
     """
-    r = db.execute(GET_WORD_SQL, [word.upper()])
-    defn = r.fetchone()
-    return "" if defn is None else defn[0]
+    return _get_def_uncached(word.upper())
 
 
 class WordList:
     """Container for tracking words and their associated scores.
     
     Attributes:
-        words: Set of words found/legal in the game.
+        words: Set of words found/legal in the game (the legal list is
+            frozen once board analysis completes).
         longest: Length of the longest word in the list.
         score: Total score of all words in the list.
         scores: Scoring table indexed by word length.
     """
-    words: set[str]
+    words: "set[str] | frozenset[str]"
     longest: int
     score: int
-    scores: list[int]
+    scores: tuple[int, ...]
 
     def __init__(self, scores: list[int]) -> None:
         """Initialize empty word list with scoring table.
-        
+
         Args:
             scores: List where scores[i] is points for word of length i.
         """
         self.words = set()
         self.longest = 0
         self.score = 0
-        self.scores = scores
+        self.scores = tuple(scores)
 
     def add(self, word: str) -> None:
         """Add a word to the list and update statistics.
-        
+
         Args:
             word: Word to add (will be normalized to lowercase).
         """
+        n = len(word)
         self.words.add(word.lower())
-        self.longest = max(self.longest, len(word))
-        self.score += self.scores[len(word)]
+        if n > self.longest:
+            self.longest = n
+        self.score += self.scores[n]
 
 
 class GuessResult(Enum):
@@ -174,12 +257,24 @@ class Game:
         self.height = height
         self.width = width
         self.scores = scores
+        # Display form of the scoring table; built once since scores are
+        # fixed for the game (stats panel shows it on every render).
+        self.scores_str = "/".join(map(str, scores))
         self.legal = WordList(scores)
         self.found = WordList(scores)
         self.bad = WordList(scores)
         self.board = []
         self.duration = duration
         self.min_legal = min_legal
+        self._missed_cache: Optional[set[str]] = None
+
+        # ctypes argument arrays are fixed for the life of a Game, so build
+        # them once here instead of re-encoding the dice and reconstructing
+        # array types on every C call. (libwords only permutes the dice
+        # array in place while shuffling, so reuse across calls is safe.)
+        self._c_scores = (c_int * len(self.scores))(*self.scores)
+        dice_bytes = [d.encode("utf8") for d in dice_set.dice]
+        self._c_dice = (c_char_p * len(dice_bytes))(*dice_bytes)
 
     def restore_game(self, dice: str) -> None:
         """Restore game from a specific dice configuration.
@@ -187,17 +282,15 @@ class Game:
         Args:
             dice: String of dice face characters to restore.
         """
-        score_arr_type = c_int * len(self.scores)
-
-        c_words.restore_game.restype = POINTER(c_char_p)
+        _dawg_ready.wait()
 
-        words_p = c_words.restore_game(
-            score_arr_type(*self.scores),
+        c_words.restore_game(
+            self._c_scores,
             self.width, self.height,
             c_char_p(dice.encode("UTF8")),
         )
 
-        self._finish(dice, words_p)
+        self._finish(dice)
 
     def fill_board(
             self,
@@ -223,23 +316,18 @@ class Game:
             random_seed: RNG seed for reproducible results (None = random).
             
         Raises:
-            Exception: If no valid board found within max_tries attempts.
+            RuntimeError: If no valid board found within max_tries attempts.
         """
+        _dawg_ready.wait()
+
         if random_seed is None:
             random_seed = randint(0, 2 ** 32 - 1)
-        dice_bytes = [d.encode('utf8') for d in self.dice_set.dice]
-        dice_arr_type = c_char_p * len(dice_bytes)
-        score_arr_type = c_int * len(self.scores)
-
-        c_words.get_words.restype = POINTER(c_char_p)
         tried = c_int(0)
         board_str_b = c_char_p()
 
-        import time
-        t = time.time()
         words_p = c_words.get_words(
-            dice_arr_type(*dice_bytes),
-            score_arr_type(*self.scores),
+            self._c_dice,
+            self._c_scores,
             self.width, self.height,
             min_words, max_words,
             min_score, max_score,
@@ -250,42 +338,76 @@ class Game:
             byref(tried),
             byref(board_str_b)
         )
-        if (not words_p): raise Exception(f"didn't find: {time.time() - t}")
+        if not words_p:
+            raise RuntimeError(
+                f"No board met the constraints within {max_tries} tries")
 
-        self._finish(board_str_b.value.decode('utf-8'), words_p)
+        self._finish(board_str_b.value.decode('utf-8'))
 
-    def _finish(self, board_str: str, words) -> None:
+    def _finish(self, board_str: str) -> None:
         """Finalize board setup after C library processing.
-        
+
+        Ingests the found words in bulk: one newline-joined buffer from C,
+        decoded and split in a single pass, rather than dereferencing and
+        decoding the C word array one element at a time.
+
         Args:
             board_str: Raw board string from C library.
-            words: C array of valid word strings.
         """
-        i = 0
-        while words[i]:
-            self.legal.add(words[i].decode('utf-8'))
-            i += 1
-
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                face = board_str[y * self.width + x]
-                row.append(self.dice_set.get_face_display(face))
-            self.board.append(row)
+        # Gameplay only ever reads the legal list once the board is built, so
+        # it is stored as a frozenset: that makes the immutability explicit
+        # and guarantees the missed-words cache can only be invalidated by
+        # found-side changes.
+        legal = self.legal
+        joined = c_words.get_words_joined()
+        if joined:
+            # The DAWG holds plain A-Z words, so the cheaper ASCII decoder
+            # is enough for the whole buffer.
+            words = joined.decode('ascii').lower().split('\n')
+            # Interned alongside the guess path (see handle_guess), so set
+            # probes can short-circuit on pointer identity.
+            legal.words = frozenset(map(sys.intern, words))
+            legal.longest = max(map(len, words))
+            legal.score = sum(legal.scores[len(w)] for w in words)
+        else:
+            legal.words = frozenset()
+
+        # Rows by comprehension over the dice set's prebuilt face->display
+        # table: a dict lookup per cell, no method calls or appends.
+        # restore_game accepts arbitrary dice strings, so the board may
+        # hold faces this set's own dice never roll; map those through
+        # get_face_display instead of failing the lookup.
+        display = self.dice_set.face_display
+        missing = set(board_str) - display.keys()
+        if missing:
+            display = {
+                **display,
+                **{f: self.dice_set.get_face_display(f) for f in missing},
+            }
+        w = self.width
+        self.board = [
+            [display[f] for f in board_str[y * w:(y + 1) * w]]
+            for y in range(self.height)
+        ]
 
     def handle_guess(self, word: str) -> GuessResult:
         """Evaluate a player's word guess.
         
         Args:
-            word: The word guessed by the player.
-            
+            word: The word guessed by the player (any case).
+
         Returns:
             Result indicating whether guess was valid, duplicate, etc.
         """
+        # Normalize once up front: the word sets hold lowercase interned
+        # words, so interning the guess lets the found/legal membership
+        # tests compare by identity before falling back to full equality.
+        word = sys.intern(word.lower())
         if word in self.found.words:
             return GuessResult.DUP
         elif word in self.legal.words:
             self.found.add(word)
+            self._missed_cache = None
             return GuessResult.GOOD
 
         defn = get_def(word)
@@ -297,26 +419,37 @@ class Game:
 
     def get_missed(self) -> set[str]:
         """Get set of valid words not yet found by player.
-        
+
+        The difference is cached and only recomputed after a successful
+        guess changes the found set, so repeated calls are O(1).
+
         Returns:
             Set of missed words.
         """
-        return self.legal.words - self.found.words
+        if self._missed_cache is None:
+            self._missed_cache = self.legal.words - self.found.words
+        return self._missed_cache
 
     def freqs(self) -> list[tuple[int, int, int]]:
         """Get word frequency statistics by length.
-        
+
+        Every found word is also legal, so one walk over the legal set
+        with a membership test against the (smaller) found set tallies
+        both columns at once.
+
         Returns:
             List of (length, legal_count, found_count) tuples.
         """
-        legal = Counter(len(w) for w in self.legal.words)
-        found = Counter(len(w) for w in self.found.words)
-        both = []
+        counts: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+        found = self.found.words
 
-        for k in sorted(legal):
-            both.append((k, legal[k], found.get(k, 0)))
-        
-        return both
+        for w in self.legal.words:
+            pair = counts[len(w)]
+            pair[0] += 1
+            if w in found:
+                pair[1] += 1
+
+        return [(k, *counts[k]) for k in sorted(counts)]
 
 
 